@@ -149,7 +149,8 @@ async def main():
 
         return 0 if len(errors) == 0 else 1
     finally:
-        # Clean up database connection
+        # Close cached Strava clients and the database connection
+        await strava_service.close_clients()
         await engine.dispose()
 
 
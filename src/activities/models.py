@@ -8,6 +8,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     Float,
+    Index,
     Integer,
     String,
 )
@@ -24,6 +25,21 @@ class Activity(Base):
     """
 
     __tablename__ = "activities"
+    __table_args__ = (
+        # Covers the leaderboard query (filter on type + date range) so it can
+        # be answered with an index-only scan; it also serves lookups by type
+        Index(
+            "ix_activities_type_start_date_local",
+            "type",
+            "start_date_local",
+            postgresql_include=[
+                "athlete_id",
+                "moving_time",
+                "distance",
+                "workout_type",
+            ],
+        ),
+    )
 
     # Primary key - Strava's activity ID
     id = Column(BigInteger, primary_key=True)
@@ -33,7 +49,7 @@ class Activity(Base):
 
     # Core activity info
     name = Column(String, nullable=False)
-    type = Column(String, nullable=False, index=True)  # Run, Ride, Swim, etc.
+    type = Column(String, nullable=False)  # Run, Ride, Swim, etc.
     sport_type = Column(String, nullable=False)  # More specific than type
     workout_type = Column(
         Integer, nullable=True
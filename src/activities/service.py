@@ -4,7 +4,8 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import literal_column, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.activities.models import Activity
@@ -12,10 +13,67 @@ from src.strava.schemas import ActivitySchema
 
 logger = logging.getLogger(__name__)
 
+# Columns overwritten when an existing activity is upserted
+# (same fields as update_activity)
+UPDATABLE_COLUMNS = (
+    "name",
+    "type",
+    "sport_type",
+    "workout_type",
+    "distance",
+    "moving_time",
+    "elapsed_time",
+    "total_elevation_gain",
+    "average_speed",
+    "max_speed",
+    "kudos_count",
+    "comment_count",
+    "athlete_count",
+    "raw_data",
+    "updated_at",
+)
+
 
 class ActivityService:
     """Service for managing activities in the database."""
 
+    @staticmethod
+    def _to_row(activity_data: ActivitySchema) -> dict:
+        """Map Strava activity data to Activity column values.
+
+        Parameters
+        ----------
+        activity_data : ActivitySchema
+            Validated activity data from Strava API
+
+        Returns
+        -------
+        dict
+            Column values for an Activity row
+        """
+        return {
+            "id": activity_data.id,
+            "athlete_id": activity_data.athlete_id,
+            "name": activity_data.name,
+            "type": activity_data.type,
+            "sport_type": activity_data.sport_type,
+            "workout_type": activity_data.workout_type,
+            "distance": activity_data.distance,
+            "moving_time": activity_data.moving_time,
+            "elapsed_time": activity_data.elapsed_time,
+            "total_elevation_gain": activity_data.total_elevation_gain,
+            "average_speed": activity_data.average_speed,
+            "max_speed": activity_data.max_speed,
+            "start_date": activity_data.start_date,
+            "start_date_local": activity_data.start_date_local,
+            "timezone": activity_data.timezone,
+            "kudos_count": activity_data.kudos_count or 0,
+            "comment_count": activity_data.comment_count or 0,
+            "athlete_count": activity_data.athlete_count or 1,
+            # Store full response for future use
+            "raw_data": activity_data.model_dump(mode="json"),
+        }
+
     async def get_activity(
         self, db: AsyncSession, activity_id: int
     ) -> Optional[Activity]:
@@ -56,40 +114,22 @@ class ActivityService:
         # Check if activity already exists
         existing = await self.get_activity(db, activity_data.id)
         if existing:
-            logger.warning(f"Activity {activity_data.id} already exists, updating")
+            logger.warning("Activity %s already exists, updating", activity_data.id)
             return await self.update_activity(db, existing, activity_data)
 
         # Create new activity
-        activity = Activity(
-            id=activity_data.id,
-            athlete_id=activity_data.athlete["id"],
-            name=activity_data.name,
-            type=activity_data.type,
-            sport_type=activity_data.sport_type,
-            workout_type=activity_data.workout_type,
-            distance=activity_data.distance,
-            moving_time=activity_data.moving_time,
-            elapsed_time=activity_data.elapsed_time,
-            total_elevation_gain=activity_data.total_elevation_gain,
-            average_speed=activity_data.average_speed,
-            max_speed=activity_data.max_speed,
-            start_date=activity_data.start_date,
-            start_date_local=activity_data.start_date_local,
-            timezone=activity_data.timezone,
-            kudos_count=activity_data.kudos_count or 0,
-            comment_count=activity_data.comment_count or 0,
-            athlete_count=activity_data.athlete_count or 1,
-            # Store full response for future use
-            raw_data=activity_data.model_dump(mode="json"),
-        )
+        activity = Activity(**self._to_row(activity_data))
 
         db.add(activity)
         await db.commit()
         await db.refresh(activity)
 
         logger.info(
-            f"Created activity {activity.id}: {activity.name} "
-            f"({activity.distance}m, {activity.type})"
+            "Created activity %s: %s (%sm, %s)",
+            activity.id,
+            activity.name,
+            activity.distance,
+            activity.type,
         )
         return activity
 
@@ -132,10 +172,65 @@ class ActivityService:
         await db.commit()
         await db.refresh(activity)
 
-        logger.info(f"Updated activity {activity.id}: {activity.name}")
+        logger.info("Updated activity %s: %s", activity.id, activity.name)
         return activity
 
-    async def delete_activity(self, db: AsyncSession, activity_id: int) -> bool:
+    async def upsert_activities(
+        self, db: AsyncSession, activities: list[ActivitySchema], commit: bool = True
+    ) -> dict[int, bool]:
+        """Insert or update activities with a single statement.
+
+        Uses PostgreSQL ``INSERT ... ON CONFLICT (id) DO UPDATE`` so a whole
+        batch is written in one round-trip and one commit.
+
+        Parameters
+        ----------
+        db : AsyncSession
+            Database session
+        activities : list[ActivitySchema]
+            Validated activity data from Strava API
+        commit : bool
+            Commit the transaction. Pass False when the caller commits a
+            larger unit of work.
+
+        Returns
+        -------
+        dict[int, bool]
+            Maps each activity ID to True if it was inserted,
+            False if an existing row was updated
+        """
+        if not activities:
+            return {}
+
+        # ON CONFLICT DO UPDATE cannot touch the same row twice in one
+        # statement, so keep only the last occurrence of each activity
+        rows = {a.id: self._to_row(a) for a in activities}
+
+        stmt = insert(Activity).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Activity.id],
+            set_={column: stmt.excluded[column] for column in UPDATABLE_COLUMNS},
+        ).returning(
+            Activity.id,
+            # xmax is 0 only for freshly inserted row versions
+            literal_column("xmax = 0").label("inserted"),
+        )
+
+        result = await db.execute(stmt)
+        inserted = {row.id: row.inserted for row in result}
+        if commit:
+            await db.commit()
+
+        logger.info(
+            "Upserted %d activities (%d created)",
+            len(inserted),
+            sum(inserted.values()),
+        )
+        return inserted
+
+    async def delete_activity(
+        self, db: AsyncSession, activity_id: int, commit: bool = True
+    ) -> bool:
         """Delete activity.
 
         Parameters
@@ -144,6 +239,9 @@ class ActivityService:
             Database session
         activity_id : int
             Activity ID to delete
+        commit : bool
+            Commit the transaction. Pass False when the caller commits a
+            larger unit of work.
 
         Returns
         -------
@@ -152,13 +250,14 @@ class ActivityService:
         """
         activity = await self.get_activity(db, activity_id)
         if not activity:
-            logger.warning(f"Activity {activity_id} not found for deletion")
+            logger.warning("Activity %s not found for deletion", activity_id)
             return False
 
         await db.delete(activity)
-        await db.commit()
+        if commit:
+            await db.commit()
 
-        logger.info(f"Deleted activity {activity_id}")
+        logger.info("Deleted activity %s", activity_id)
         return True
 
     async def get_athlete_activities(
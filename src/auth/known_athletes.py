@@ -0,0 +1,103 @@
+"""In-process registry of athletes registered with the app."""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator, Optional
+
+from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.auth.service import auth_service
+from src.core.lifespan import manager
+
+logger = logging.getLogger(__name__)
+
+# Seconds between reloads of the registry from the database
+REFRESH_INTERVAL = 60
+
+
+class KnownAthletes:
+    """Set of authorized athlete IDs kept in memory.
+
+    Strava webhook subscriptions are application-wide, so events arrive for
+    athletes who never registered here. Checking this set lets them be
+    dropped without a database lookup. Until the first load succeeds every
+    athlete is treated as known, so no events are lost on startup.
+    """
+
+    def __init__(self):
+        self._athlete_ids: set[int] = set()
+        self._loaded = False
+        # athlete_id -> added (True) or discarded (False) while a refresh
+        # is reading the database; None when no refresh is running
+        self._changes: Optional[dict[int, bool]] = None
+
+    def __contains__(self, athlete_id: int) -> bool:
+        return not self._loaded or athlete_id in self._athlete_ids
+
+    def add(self, athlete_id: int) -> None:
+        """Register an athlete, e.g. right after authorization."""
+        self._athlete_ids.add(athlete_id)
+        if self._changes is not None:
+            self._changes[athlete_id] = True
+
+    def discard(self, athlete_id: int) -> None:
+        """Forget an athlete, e.g. after deauthorization."""
+        self._athlete_ids.discard(athlete_id)
+        if self._changes is not None:
+            self._changes[athlete_id] = False
+
+    async def refresh(self, session_maker: async_sessionmaker) -> None:
+        """Reload the authorized athlete IDs from the database.
+
+        Parameters
+        ----------
+        session_maker : async_sessionmaker
+            Database session maker
+        """
+        # The snapshot may predate add() or discard() calls made while the
+        # query runs, so record those and apply them on top of it
+        self._changes = {}
+        try:
+            async with session_maker() as db:
+                athlete_ids = await auth_service.list_authorized_athlete_ids(db)
+
+            athlete_ids = set(athlete_ids)
+            for athlete_id, added in self._changes.items():
+                if added:
+                    athlete_ids.add(athlete_id)
+                else:
+                    athlete_ids.discard(athlete_id)
+        finally:
+            self._changes = None
+
+        self._athlete_ids = athlete_ids
+        self._loaded = True
+        logger.debug("Loaded %d known athletes", len(athlete_ids))
+
+    async def refresh_forever(self, session_maker: async_sessionmaker) -> None:
+        """Reload the registry every ``REFRESH_INTERVAL`` seconds."""
+        while True:
+            try:
+                await self.refresh(session_maker)
+            except (SQLAlchemyError, OSError) as e:
+                logger.error("Failed to refresh known athletes: %s", e)
+            await asyncio.sleep(REFRESH_INTERVAL)
+
+
+known_athletes = KnownAthletes()
+
+
+@manager.add
+@asynccontextmanager
+async def known_athletes_lifespan(app: FastAPI) -> AsyncIterator[dict]:
+    """Keep the known athletes registry fresh while the app runs."""
+    task = asyncio.create_task(known_athletes.refresh_forever(app.state.session_maker))
+
+    yield {}
+
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
@@ -32,8 +32,8 @@ class User(Base):
         onupdate=lambda: datetime.now(timezone.utc),
     )
 
-    def is_token_expired(self) -> bool:
-        return time.time() > self.token_expires_at
+    def is_token_expired(self, margin: int = 0) -> bool:
+        return time.time() > self.token_expires_at - margin
 
     @property
     def athlete_id(self) -> int:
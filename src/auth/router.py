@@ -1,6 +1,7 @@
 from datetime import datetime
 from pathlib import Path
 
+import httpx
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse
 from fastapi.templating import Jinja2Templates
@@ -8,11 +9,13 @@ from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 from stravalib import Client
 
+from src.auth.known_athletes import known_athletes
 from src.auth.schemas import UserResponse
 from src.auth.service import auth_service
 from src.config import get_settings
-from src.dependencies import get_session, verify_admin_api_key
+from src.dependencies import get_http_client, get_session, verify_admin_api_key
 from src.strava.client import AsyncStravaClient
+from src.strava.service import strava_service
 from src.sync.service import sync_service
 
 settings = get_settings()
@@ -44,6 +47,7 @@ async def callback(
     code: str,
     background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_session),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
 ):
     """Handle OAuth callback with club membership validation"""
     logger.info("OAuth callback received", has_code=bool(code))
@@ -59,47 +63,49 @@ async def callback(
         )
 
         # Create async client for validation
-        async_client = AsyncStravaClient(access_token=token_response["access_token"])
-
-        # Get athlete info
-        athlete = await async_client.get_athlete()
-        logger.info(
-            "Retrieved athlete info",
-            athlete_id=athlete.id,
-            name=f"{athlete.firstname} {athlete.lastname}",
-        )
+        async with AsyncStravaClient(
+            access_token=token_response["access_token"], http_client=http_client
+        ) as async_client:
+            # Get athlete info
+            athlete = await async_client.get_athlete()
+            logger.info(
+                "Retrieved athlete info",
+                athlete_id=athlete.id,
+                name=f"{athlete.firstname} {athlete.lastname}",
+            )
 
-        # Validate club membership
-        logger.debug("Checking club membership", athlete_id=athlete.id)
-        clubs = await async_client.get_athlete_clubs()
-        club_ids = [club.id for club in clubs]
+            # Validate club membership
+            logger.debug("Checking club membership", athlete_id=athlete.id)
+            clubs = await async_client.get_athlete_clubs()
+            club_ids = [club.id for club in clubs]
 
-        # Debug: Log detailed club information
-        logger.info(
-            "Clubs returned by Strava API",
-            athlete_id=athlete.id,
-            club_count=len(clubs),
-            clubs_data=[{"id": club.id, "name": club.name} for club in clubs],
-        )
-
-        if settings.STRAVA_CLUB_ID not in club_ids:
-            # Not a club member - deauthorize and reject
-            logger.warning(
-                "Club membership validation failed",
+            # Debug: Log detailed club information
+            logger.info(
+                "Clubs returned by Strava API",
                 athlete_id=athlete.id,
-                clubs=club_ids,
-                required_club=settings.STRAVA_CLUB_ID,
-            )
-            await async_client.deauthorize()
-            return RedirectResponse(
-                url=(
-                    "/auth/error?message=Not+a+club+member"
-                    "&error=You+must+be+a+member+of+our+club"
-                ),
-                status_code=303,
+                club_count=len(clubs),
+                clubs_data=[{"id": club.id, "name": club.name} for club in clubs],
             )
 
+            if settings.STRAVA_CLUB_ID not in club_ids:
+                # Not a club member - deauthorize and reject
+                logger.warning(
+                    "Club membership validation failed",
+                    athlete_id=athlete.id,
+                    clubs=club_ids,
+                    required_club=settings.STRAVA_CLUB_ID,
+                )
+                await async_client.deauthorize()
+                return RedirectResponse(
+                    url=(
+                        "/auth/error?message=Not+a+club+member"
+                        "&error=You+must+be+a+member+of+our+club"
+                    ),
+                    status_code=303,
+                )
+
         logger.info("Club membership validated", athlete_id=athlete.id)
+        known_athletes.add(athlete.id)
 
         # Club member - proceed with user creation/update
         existing_user = await auth_service.get_user_by_athlete_id(db, athlete.id)
@@ -113,6 +119,8 @@ async def callback(
                 refresh_token=token_response["refresh_token"],
                 expires_at=token_response["expires_at"],
             )
+            # Cached clients still hold the old access token
+            strava_service.invalidate(athlete.id)
             # Update profile pictures on re-authorization
             _ = await auth_service.update_profile_pictures(
                 db=db,
@@ -148,6 +156,7 @@ async def callback(
                 db=db,
                 athlete_id=athlete.id,
                 after=datetime(2026, 1, 1),
+                http_client=http_client,
             )
 
         logger.info(
@@ -233,6 +242,9 @@ async def deauthorize_user(
         logger.warning("Deauthorization failed - user not found", athlete_id=athlete_id)
         raise HTTPException(status_code=404, detail="User not found")
 
+    known_athletes.discard(athlete_id)
+    strava_service.invalidate(athlete_id)
+
     logger.info(
         "User deauthorized successfully",
         athlete_id=athlete_id,
@@ -71,8 +71,10 @@ class AuthService:
             await db.rollback()
             raise e
 
-    async def refresh_token_if_needed(self, db: AsyncSession, user: User) -> User:
-        if user.is_token_expired():
+    async def refresh_token_if_needed(
+        self, db: AsyncSession, user: User, margin: int = 0
+    ) -> User:
+        if user.is_token_expired(margin):
             client = Client()
             try:
                 token_response = client.refresh_access_token(
@@ -97,6 +99,10 @@ class AuthService:
         result = await db.execute(select(User).filter(User.authorized))
         return list(result.scalars().all())
 
+    async def list_authorized_athlete_ids(self, db: AsyncSession) -> list[int]:
+        result = await db.execute(select(User.id).filter(User.authorized))
+        return list(result.scalars().all())
+
     async def deauthorize_user(
         self, db: AsyncSession, athlete_id: int
     ) -> Optional[User]:
@@ -23,9 +23,13 @@ class Settings(BaseSettings):
     STRAVA_REDIRECT_URI: str
     STRAVA_VERIFY_TOKEN: str
     STRAVA_CLUB_ID: int
+    STRAVA_CONCURRENCY: int = 10  # Max concurrent Strava fetches for webhooks
 
     # Webhooks (optional - only needed for webhook functionality)
     WEBHOOK_BASE_URL: str | None = None
+    WEBHOOK_WORKERS: int = 8  # Concurrent webhook event workers
+    WEBHOOK_QUEUE_SIZE: int = 10000  # Max pending webhook events before 503
+    HANDLE_ATHLETE_UPDATES: bool = False  # Queue athlete profile update events
 
     # CORS
     CORS_ORIGINS: list[str] = ["*"]
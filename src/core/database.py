@@ -31,7 +31,8 @@ async def database_lifespan() -> AsyncIterator[dict]:
     engine: AsyncEngine = create_async_engine(
         settings.DATABASE_URL,
         pool_pre_ping=True,
-        pool_size=10,
+        # One connection per webhook worker on top of those for requests
+        pool_size=10 + settings.WEBHOOK_WORKERS,
         max_overflow=20,
         # echo=settings.ENVIRONMENT == "local",
     )
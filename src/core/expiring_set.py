@@ -0,0 +1,58 @@
+"""Bounded in-process set and mapping whose entries expire."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class ExpiringDict:
+    """Mapping that forgets keys ``ttl`` seconds after they are set.
+
+    Holds at most ``maxsize`` keys; the oldest are evicted first.
+    Not thread-safe; meant for use from a single event loop.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (time.monotonic() when set, value)
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and time.monotonic() - entry[0] < self.ttl
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        """Set a key, restarting its expiry, and evict stale keys."""
+        now = time.monotonic()
+        self._entries[key] = (now, value)
+        self._entries.move_to_end(key)
+
+        cutoff = now - self.ttl
+        while self._entries and (
+            len(self._entries) > self.maxsize
+            or next(iter(self._entries.values()))[0] < cutoff
+        ):
+            self._entries.popitem(last=False)
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        """Return the value for a key that hasn't expired, else ``default``."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return default
+        return entry[1]
+
+
+class ExpiringSet(ExpiringDict):
+    """Set that forgets members after ``ttl`` seconds.
+
+    Holds at most ``maxsize`` members; the oldest are evicted first.
+    Not thread-safe; meant for use from a single event loop.
+    """
+
+    def add(self, member: Hashable) -> None:
+        """Add a member, restarting its expiry, and evict stale members."""
+        self[member] = None
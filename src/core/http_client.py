@@ -0,0 +1,33 @@
+"""Shared HTTP client for outbound API calls."""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import httpx
+from loguru import logger
+
+from src.core.lifespan import manager
+
+
+@manager.add
+@asynccontextmanager
+async def http_client_lifespan() -> AsyncIterator[dict]:
+    """
+    Manage the shared HTTP client lifecycle.
+    Creates one connection pool on startup so outbound requests reuse
+    keep-alive connections, closes it on shutdown.
+    """
+    logger.info("Initializing HTTP client")
+
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        timeout=httpx.Timeout(30.0),
+    )
+
+    logger.info("HTTP client ready")
+
+    yield {"http_client": http_client}
+
+    logger.info("Closing HTTP client")
+    await http_client.aclose()
+    logger.info("HTTP client closed")
@@ -35,6 +35,9 @@ class LifespanManager:
         """
         Execute all registered lifespans and merge their states.
         Called automatically by FastAPI.
+
+        Each state is also set on ``app.state`` as it is entered, so a
+        lifespan can use the state of those registered before it.
         """
         async with AsyncExitStack() as stack:
             combined_state = {}
@@ -48,6 +51,8 @@ class LifespanManager:
                 state = await stack.enter_async_context(context)
                 if state:
                     combined_state.update(state)
+                    for key, value in state.items():
+                        setattr(app.state, key, value)
 
             yield combined_state
 
@@ -113,8 +113,11 @@ def configure_logging() -> None:
             logger_opt = logger.opt(depth=depth, exception=record.exc_info)
             logger_opt.log(level, record.getMessage())
 
-    # Replace standard logging handlers with our interceptor
-    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+    # Replace standard logging handlers with our interceptor. The root level
+    # matches LOG_LEVEL so disabled records are dropped before formatting.
+    logging.basicConfig(
+        handlers=[InterceptHandler()], level=settings.LOG_LEVEL, force=True
+    )
 
     # Set levels for noisy third-party loggers
     logging.getLogger("uvicorn").setLevel(logging.INFO)
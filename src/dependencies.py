@@ -2,6 +2,7 @@
 
 from typing import AsyncIterator, cast
 
+import httpx
 from fastapi import HTTPException, Request, Security
 from fastapi.security import APIKeyHeader
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
@@ -45,6 +46,18 @@ async def get_redis(request: Request) -> FakeRedis:
     return cast(FakeRedis, request.state.redis)
 
 
+async def get_http_client(request: Request) -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client from application state.
+
+    Usage:
+        @app.get("/athlete")
+        async def get_athlete(http_client: httpx.AsyncClient = Depends(get_http_client)):
+            ...
+    """
+    return cast(httpx.AsyncClient, request.state.http_client)
+
+
 async def verify_admin_api_key(api_key: str = Security(api_key_header)) -> None:
     """
     Verify admin API key from X-API-Key header.
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.core.cache  # noqa: F401
 import src.core.database  # noqa: F401
+import src.core.http_client  # noqa: F401
 import src.core.logging_config  # noqa: F401 - registers logging lifespan
 from src.auth.router import router as auth_router
 from src.config import get_settings
@@ -1,9 +1,8 @@
 """Service layer for scoring calculations."""
 
 from datetime import datetime
-from itertools import groupby
 
-from sqlalchemy import select
+from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.activities.models import Activity
@@ -16,6 +15,27 @@ from src.scoring.calculator import (
 )
 from src.scoring.schemas import AthleteBreakdown, DailyActivity, LeaderboardEntry
 
+# SQL equivalent of calculate_base_points(): round(moving_time / 60) with
+# Python's round-half-to-even, in integer arithmetic so it matches exactly
+_BASE_POINTS = (Activity.moving_time + 30) // 60 - case(
+    (Activity.moving_time % 120 == 30, 1), else_=0
+)
+
+# Calendar day of an activity. start_date_local holds the athlete's local wall
+# clock time as UTC, so take the date in UTC regardless of session time zone.
+_ACTIVITY_DAY = func.date(func.timezone("UTC", Activity.start_date_local))
+
+# Columns needed to build DailyActivity entries. Selecting these instead of
+# the Activity entity skips ORM instance construction and the raw_data blob.
+_DAILY_ACTIVITY_COLUMNS = (
+    Activity.id,
+    Activity.name,
+    Activity.moving_time,
+    Activity.distance,
+    Activity.workout_type,
+    Activity.start_date_local,
+)
+
 
 class ScoringService:
     """Service for calculating athlete scores and leaderboards."""
@@ -46,103 +66,38 @@ class ScoringService:
         # Get week boundaries
         week_start, week_end = get_week_boundaries(date)
 
-        # Query all Run activities for the week
-        result = await db.execute(
-            select(Activity)
-            .filter(
-                Activity.type == "Run",
-                Activity.start_date_local >= week_start,
-                Activity.start_date_local < week_end,
-            )
-            .order_by(Activity.athlete_id, Activity.start_date_local)
-        )
-        activities = list(result.scalars().all())
-
-        # Group activities by athlete
-        athlete_activities = {
-            athlete_id: list(group)
-            for athlete_id, group in groupby(activities, key=lambda a: a.athlete_id)
-        }
-
-        # Get all athlete IDs and fetch their user info
-        athlete_ids = list(athlete_activities.keys())
-        if not athlete_ids:
-            return []
-
-        user_result = await db.execute(select(User).filter(User.id.in_(athlete_ids)))
-        users = {user.id: user for user in user_result.scalars().all()}
-
-        # Calculate scores for each athlete
-        leaderboard: list[LeaderboardEntry] = []
-
-        for athlete_id, athlete_acts in athlete_activities.items():
-            # Skip if user not found
-            user = users.get(athlete_id)
-            if user is None:
-                continue
-
-            # Calculate base points
-            base_points = sum(
-                calculate_base_points(activity.moving_time) for activity in athlete_acts
-            )
-
-            # Calculate total time (in hours) and distance (in km)
-            total_time_seconds = sum(activity.moving_time for activity in athlete_acts)
-            total_time = total_time_seconds / 3600  # Convert to hours
-            total_distance_meters = sum(activity.distance for activity in athlete_acts)
-            total_distance = total_distance_meters / 1000  # Convert to km
+        return await self._build_leaderboard(db, week_start, week_end)
 
-            # Calculate average pace (min/km)
-            avg_pace = None
-            if total_distance > 0:
-                avg_pace = (total_time_seconds / 60) / total_distance  # min/km
-
-            # Count unique days
-            unique_dates = {
-                activity.start_date_local.date() for activity in athlete_acts
-            }
-            days_active = len(unique_dates)
-
-            # Count races (workout_type == 1)
-            race_count = sum(
-                1 for activity in athlete_acts if activity.workout_type == 1
-            )
-
-            # Calculate bonuses
-            consistency_bonus = calculate_consistency_bonus(days_active)
-            race_bonus = calculate_race_bonus(race_count)
-
-            # Calculate total
-            total_points = base_points + consistency_bonus + race_bonus
-
-            # Only include athletes with >0 points
-            if total_points > 0:
-                entry = LeaderboardEntry(
-                    athlete_id=athlete_id,
-                    athlete_name=f"{user.firstname} {user.lastname}",
-                    profile=user.profile,
-                    profile_medium=user.profile_medium,
-                    base_points=base_points,
-                    consistency_bonus=consistency_bonus,
-                    race_bonus=race_bonus,
-                    total_points=total_points,
-                    days_active=days_active,
-                    race_count=race_count,
-                    total_time=total_time,
-                    total_distance=total_distance,
-                    avg_pace=avg_pace,
-                )
-                leaderboard.append(entry)
+    async def get_range_leaderboard(
+        self, db: AsyncSession, start_date: datetime, end_date: datetime
+    ) -> list[LeaderboardEntry]:
+        """Calculate cumulative scores for date range.
 
-        # Sort by total points descending
-        leaderboard.sort(key=lambda x: x.total_points, reverse=True)
+        Parameters
+        ----------
+        db : AsyncSession
+            Database session
+        start_date : datetime
+            Start of date range (inclusive)
+        end_date : datetime
+            End of date range (exclusive)
 
-        return leaderboard
+        Returns
+        -------
+        list[LeaderboardEntry]
+            Leaderboard entries sorted by total points (descending).
+            Only includes athletes with >0 points.
+        """
+        return await self._build_leaderboard(db, start_date, end_date)
 
-    async def get_range_leaderboard(
+    async def _build_leaderboard(
         self, db: AsyncSession, start_date: datetime, end_date: datetime
     ) -> list[LeaderboardEntry]:
-        """Calculate cumulative scores for date range.
+        """Aggregate Run activities in a date range into leaderboard entries.
+
+        Per-athlete totals are computed by the database in a single grouped
+        query joined with the athlete's user info, so only one row per athlete
+        is returned.
 
         Parameters
         ----------
@@ -159,71 +114,49 @@ class ScoringService:
             Leaderboard entries sorted by total points (descending).
             Only includes athletes with >0 points.
         """
-        # Query all Run activities in the date range
+        # Aggregate all Run activities in the date range per athlete
+        # (inner join skips activities of unknown athletes)
         result = await db.execute(
-            select(Activity)
+            select(
+                Activity.athlete_id,
+                User.firstname,
+                User.lastname,
+                User.profile,
+                User.profile_medium,
+                func.sum(_BASE_POINTS).label("base_points"),
+                func.sum(Activity.moving_time).label("total_time_seconds"),
+                func.sum(Activity.distance).label("total_distance_meters"),
+                func.count(func.distinct(_ACTIVITY_DAY)).label("days_active"),
+                # Count races (workout_type == 1)
+                func.count().filter(Activity.workout_type == 1).label("race_count"),
+            )
+            .join(User, User.id == Activity.athlete_id)
             .filter(
                 Activity.type == "Run",
                 Activity.start_date_local >= start_date,
                 Activity.start_date_local < end_date,
             )
-            .order_by(Activity.athlete_id, Activity.start_date_local)
+            .group_by(Activity.athlete_id, User.id)
         )
-        activities = list(result.scalars().all())
-
-        # Group activities by athlete
-        athlete_activities = {
-            athlete_id: list(group)
-            for athlete_id, group in groupby(activities, key=lambda a: a.athlete_id)
-        }
-
-        # Get all athlete IDs and fetch their user info
-        athlete_ids = list(athlete_activities.keys())
-        if not athlete_ids:
-            return []
-
-        user_result = await db.execute(select(User).filter(User.id.in_(athlete_ids)))
-        users = {user.id: user for user in user_result.scalars().all()}
 
         # Calculate scores for each athlete
         leaderboard: list[LeaderboardEntry] = []
 
-        for athlete_id, athlete_acts in athlete_activities.items():
-            # Skip if user not found
-            user = users.get(athlete_id)
-            if user is None:
-                continue
-
-            # Calculate base points
-            base_points = sum(
-                calculate_base_points(activity.moving_time) for activity in athlete_acts
-            )
+        for row in result.all():
+            base_points = int(row.base_points)
 
-            # Calculate total time (in hours) and distance (in km)
-            total_time_seconds = sum(activity.moving_time for activity in athlete_acts)
-            total_time = total_time_seconds / 3600  # Convert to hours
-            total_distance_meters = sum(activity.distance for activity in athlete_acts)
-            total_distance = total_distance_meters / 1000  # Convert to km
+            # Convert to hours and km
+            total_time = row.total_time_seconds / 3600
+            total_distance = row.total_distance_meters / 1000
 
             # Calculate average pace (min/km)
             avg_pace = None
             if total_distance > 0:
-                avg_pace = (total_time_seconds / 60) / total_distance  # min/km
-
-            # Count unique days
-            unique_dates = {
-                activity.start_date_local.date() for activity in athlete_acts
-            }
-            days_active = len(unique_dates)
-
-            # Count races (workout_type == 1)
-            race_count = sum(
-                1 for activity in athlete_acts if activity.workout_type == 1
-            )
+                avg_pace = (row.total_time_seconds / 60) / total_distance  # min/km
 
             # Calculate bonuses
-            consistency_bonus = calculate_consistency_bonus(days_active)
-            race_bonus = calculate_race_bonus(race_count)
+            consistency_bonus = calculate_consistency_bonus(row.days_active)
+            race_bonus = calculate_race_bonus(row.race_count)
 
             # Calculate total
             total_points = base_points + consistency_bonus + race_bonus
@@ -231,16 +164,16 @@ class ScoringService:
             # Only include athletes with >0 points
             if total_points > 0:
                 entry = LeaderboardEntry(
-                    athlete_id=athlete_id,
-                    athlete_name=f"{user.firstname} {user.lastname}",
-                    profile=user.profile,
-                    profile_medium=user.profile_medium,
+                    athlete_id=row.athlete_id,
+                    athlete_name=f"{row.firstname} {row.lastname}",
+                    profile=row.profile,
+                    profile_medium=row.profile_medium,
                     base_points=base_points,
                     consistency_bonus=consistency_bonus,
                     race_bonus=race_bonus,
                     total_points=total_points,
-                    days_active=days_active,
-                    race_count=race_count,
+                    days_active=row.days_active,
+                    race_count=row.race_count,
                     total_time=total_time,
                     total_distance=total_distance,
                     avg_pace=avg_pace,
@@ -293,7 +226,7 @@ class ScoringService:
 
         # Query all Run activities for this athlete in the week
         result = await db.execute(
-            select(Activity)
+            select(*_DAILY_ACTIVITY_COLUMNS)
             .filter(
                 Activity.athlete_id == athlete_id,
                 Activity.type == "Run",
@@ -302,7 +235,11 @@ class ScoringService:
             )
             .order_by(Activity.start_date_local)
         )
-        activities = list(result.scalars().all())
+        activities = result.all()
+
+        # Count unique days
+        unique_dates = {activity.start_date_local.date() for activity in activities}
+        days_active = len(unique_dates)
 
         # Build daily activities list
         daily_activities: list[DailyActivity] = []
@@ -333,13 +270,6 @@ class ScoringService:
         # Calculate totals
         base_points = sum(activity.points for activity in daily_activities)
 
-        # Count unique days
-        unique_dates = {
-            datetime.fromisoformat(activity.date).date()
-            for activity in daily_activities
-        }
-        days_active = len(unique_dates)
-
         # Count races
         race_count = sum(1 for activity in daily_activities if activity.is_race)
 
@@ -412,14 +342,14 @@ class ScoringService:
 
         # Query all Run activities for this athlete (for stats calculation)
         result = await db.execute(
-            select(Activity)
+            select(*_DAILY_ACTIVITY_COLUMNS)
             .filter(
                 Activity.athlete_id == athlete_id,
                 Activity.type == "Run",
             )
             .order_by(Activity.start_date_local.desc())
         )
-        all_activities = list(result.scalars().all())
+        all_activities = result.all()
 
         # Calculate all-time stats
         base_points = sum(
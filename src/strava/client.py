@@ -1,9 +1,11 @@
 """Async Strava API client."""
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import httpx
+import orjson
 from loguru import logger
+from pydantic import TypeAdapter
 
 from src.core.request_context import get_request_id
 from src.strava.exceptions import (
@@ -20,6 +22,11 @@ from src.strava.schemas import (
     WebhookSubscriptionSchema,
 )
 
+# Validators for list responses, built once per process
+_ACTIVITY_LIST = TypeAdapter(list[ActivitySchema])
+_CLUB_LIST = TypeAdapter(list[ClubSchema])
+_WEBHOOK_SUBSCRIPTION_LIST = TypeAdapter(list[WebhookSubscriptionSchema])
+
 
 class AsyncStravaClient:
     """Async HTTP client for Strava API v3.
@@ -34,6 +41,8 @@ class AsyncStravaClient:
         self,
         access_token: str,
         rate_limiter: Optional[AsyncRateLimiter] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        on_unauthorized: Optional[Callable[[], None]] = None,
     ):
         """Initialize Strava API client.
 
@@ -43,9 +52,42 @@ class AsyncStravaClient:
             Valid Strava access token for the athlete
         rate_limiter : AsyncRateLimiter, optional
             Custom rate limiter. If None, uses default high-priority limiter.
+        http_client : httpx.AsyncClient, optional
+            Shared HTTP client to send requests with. It is not closed by
+            this client. If None, the client creates and owns its own.
+        on_unauthorized : Callable[[], None], optional
+            Called when Strava rejects the access token (401), before
+            AccessUnauthorized is raised.
         """
         self.access_token = access_token
         self.rate_limiter = rate_limiter or AsyncRateLimiter(priority="high")
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        self.on_unauthorized = on_unauthorized
+
+    async def __aenter__(self) -> "AsyncStravaClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the underlying HTTP client, creating it on first use.
+
+        The client is kept open between requests so keep-alive connections
+        to Strava are reused.
+        """
+        if self._http_client is None or (
+            self._owns_http_client and self._http_client.is_closed
+        ):
+            self._http_client = httpx.AsyncClient(timeout=30.0)
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client if this client owns it."""
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     async def _request(
         self,
@@ -54,8 +96,32 @@ class AsyncStravaClient:
         params: Optional[dict[str, Any]] = None,
         json_data: Optional[dict[str, Any]] = None,
     ) -> Any:
+        """Make an authenticated request and decode the JSON response.
+
+        See ``_request_raw`` for parameters and raised exceptions.
+
+        Returns
+        -------
+        dict or list
+            Parsed JSON response (empty dict for empty responses)
+        """
+        content = await self._request_raw(method, endpoint, params, json_data)
+        if not content:
+            return {}
+        return orjson.loads(content)
+
+    async def _request_raw(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        json_data: Optional[dict[str, Any]] = None,
+    ) -> bytes:
         """Make an authenticated request to Strava API.
 
+        Returns the undecoded body so typed endpoints can parse and validate
+        it in a single pass with ``model_validate_json``.
+
         Parameters
         ----------
         method : str
@@ -69,8 +135,8 @@ class AsyncStravaClient:
 
         Returns
         -------
-        dict or list
-            Parsed JSON response
+        bytes
+            Raw response body (empty for 204 No Content)
 
         Raises
         ------
@@ -85,11 +151,6 @@ class AsyncStravaClient:
         """
         url = f"{self.BASE_URL}{endpoint}"
 
-        # Add access token to params
-        if params is None:
-            params = {}
-        params["access_token"] = self.access_token
-
         logger.debug(
             "Strava API request",
             method=method,
@@ -97,25 +158,30 @@ class AsyncStravaClient:
             request_id=get_request_id(),
         )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method=method, url=url, params=params, json=json_data, timeout=30.0
-            )
+        # Send the token per request so athletes can share one HTTP client,
+        # and keep it out of URLs that httpx logs
+        response = await self._get_http_client().request(
+            method=method,
+            url=url,
+            params=params,
+            json=json_data,
+            headers={"Authorization": f"Bearer {self.access_token}"},
+        )
 
-            # Update rate limits from response headers
-            self.rate_limiter.update_limits(dict(response.headers))
+        # Update rate limits from response headers
+        self.rate_limiter.update_limits(response.headers)
 
-            # Handle errors
-            await self._handle_errors(response)
+        # Handle errors
+        await self._handle_errors(response)
 
-            # Apply rate limiting for next request
-            await self.rate_limiter.wait_if_needed()
+        # Apply rate limiting for next request
+        await self.rate_limiter.wait_if_needed()
 
-            # Handle empty responses (204 No Content)
-            if response.status_code == 204:
-                return {}
+        # Handle empty responses (204 No Content)
+        if response.status_code == 204:
+            return b""
 
-            return response.json()
+        return response.content
 
     async def _handle_errors(self, response: httpx.Response) -> None:
         """Handle HTTP errors from Strava API.
@@ -133,16 +199,19 @@ class AsyncStravaClient:
             return
 
         # Try to get error message from response
-        try:
-            error_data = response.json()
-            error_msg = error_data.get("message", response.text)
-        except Exception:
-            error_msg = response.text
+        error_msg = response.text
+        if response.content:
+            try:
+                error_msg = response.json().get("message", error_msg)
+            except (ValueError, AttributeError):
+                pass
 
         # Raise appropriate exception
         if response.status_code == 404:
             raise ObjectNotFound(f"Not found: {error_msg}")
         elif response.status_code == 401:
+            if self.on_unauthorized is not None:
+                self.on_unauthorized()
             raise AccessUnauthorized(f"Unauthorized: {error_msg}")
         elif response.status_code == 429:
             raise RateLimitExceeded(f"Rate limit exceeded: {error_msg}")
@@ -165,8 +234,8 @@ class AsyncStravaClient:
         AthleteSchema
             Athlete information
         """
-        data = await self._request("GET", "/athlete")
-        return AthleteSchema.model_validate(data)
+        content = await self._request_raw("GET", "/athlete")
+        return AthleteSchema.model_validate_json(content)
 
     async def get_athlete_clubs(self) -> list[ClubSchema]:
         """Get clubs the authenticated athlete belongs to.
@@ -176,8 +245,8 @@ class AsyncStravaClient:
         list[ClubSchema]
             List of clubs the athlete is a member of
         """
-        data = await self._request("GET", "/athlete/clubs")
-        return [ClubSchema.model_validate(club) for club in data]
+        content = await self._request_raw("GET", "/athlete/clubs")
+        return _CLUB_LIST.validate_json(content)
 
     async def deauthorize(self) -> None:
         """Revoke the current access token.
@@ -222,8 +291,8 @@ class AsyncStravaClient:
         if after:
             params["after"] = after
 
-        data = await self._request("GET", "/athlete/activities", params=params)
-        return [ActivitySchema.model_validate(item) for item in data]
+        content = await self._request_raw("GET", "/athlete/activities", params=params)
+        return _ACTIVITY_LIST.validate_json(content)
 
     async def get_activity(self, activity_id: int) -> ActivitySchema:
         """Get details of a specific activity.
@@ -238,8 +307,8 @@ class AsyncStravaClient:
         ActivitySchema
             Activity details
         """
-        data = await self._request("GET", f"/activities/{activity_id}")
-        return ActivitySchema.model_validate(data)
+        content = await self._request_raw("GET", f"/activities/{activity_id}")
+        return ActivitySchema.model_validate_json(content)
 
     # =========================================================================
     # Webhook Subscription Endpoints
@@ -276,8 +345,8 @@ class AsyncStravaClient:
             "callback_url": callback_url,
             "verify_token": verify_token,
         }
-        data = await self._request("POST", "/push_subscriptions", params=params)
-        return WebhookSubscriptionSchema.model_validate(data)
+        content = await self._request_raw("POST", "/push_subscriptions", params=params)
+        return WebhookSubscriptionSchema.model_validate_json(content)
 
     async def list_webhook_subscriptions(
         self, client_id: int, client_secret: str
@@ -297,8 +366,8 @@ class AsyncStravaClient:
             List of subscriptions
         """
         params = {"client_id": client_id, "client_secret": client_secret}
-        data = await self._request("GET", "/push_subscriptions", params=params)
-        return [WebhookSubscriptionSchema.model_validate(item) for item in data]
+        content = await self._request_raw("GET", "/push_subscriptions", params=params)
+        return _WEBHOOK_SUBSCRIPTION_LIST.validate_json(content)
 
     async def delete_webhook_subscription(
         self, subscription_id: int, client_id: int, client_secret: str
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from collections.abc import Mapping
 from typing import Literal, Optional
 
 from src.strava.schemas import RateLimitInfo
@@ -29,25 +30,25 @@ class AsyncRateLimiter:
         """
         self.priority = priority
         self.current_limits: Optional[RateLimitInfo] = None
+        # Concurrent requests through one limiter wait their turn, so pacing
+        # holds however many are in flight
+        self._lock = asyncio.Lock()
 
-    def update_limits(self, headers: dict[str, str]) -> None:
+    def update_limits(self, headers: Mapping[str, str]) -> None:
         """Update rate limit info from response headers.
 
         Parameters
         ----------
-        headers : dict
-            HTTP response headers from Strava API
+        headers : Mapping[str, str]
+            HTTP response headers from Strava API. Expected to be a
+            case-insensitive mapping such as ``httpx.Headers``.
         """
-        # Normalize header keys to lowercase
-        headers_lower = {k.lower(): v for k, v in headers.items()}
+        usage_header = headers.get("x-ratelimit-usage")
+        limit_header = headers.get("x-ratelimit-limit")
 
-        # Try both header formats Strava uses
-        usage_key = "x-ratelimit-usage"
-        limit_key = "x-ratelimit-limit"
-
-        if usage_key in headers_lower and limit_key in headers_lower:
-            usage = [int(x) for x in headers_lower[usage_key].split(",")]
-            limit = [int(x) for x in headers_lower[limit_key].split(",")]
+        if usage_header and limit_header:
+            usage = [int(x) for x in usage_header.split(",")]
+            limit = [int(x) for x in limit_header.split(",")]
 
             self.current_limits = RateLimitInfo(
                 short_usage=usage[0],
@@ -55,12 +56,20 @@ class AsyncRateLimiter:
                 short_limit=limit[0],
                 long_limit=limit[1],
             )
-            logger.debug(f"Updated rate limits: {self.current_limits}")
+            logger.debug("Updated rate limits: %s", self.current_limits)
         else:
             logger.warning("No rate limit headers found in response")
 
     async def wait_if_needed(self) -> None:
-        """Sleep if rate limits require it based on priority."""
+        """Sleep if rate limits require it based on priority.
+
+        Calls are serialized, so concurrent callers sleep one after another.
+        """
+        async with self._lock:
+            await self._wait()
+
+    async def _wait(self) -> None:
+        """Sleep for as long as the current limits and priority require."""
         if not self.current_limits:
             return
 
@@ -69,7 +78,9 @@ class AsyncRateLimiter:
         # Check if limits exceeded
         if limits.long_usage >= limits.long_limit:
             logger.warning(
-                f"Long-term rate limit exceeded: {limits.long_usage}/{limits.long_limit}"
+                "Long-term rate limit exceeded: %d/%d",
+                limits.long_usage,
+                limits.long_limit,
             )
             # Wait until next day (simplified - in prod calculate exact time)
             await asyncio.sleep(60)
@@ -77,7 +88,9 @@ class AsyncRateLimiter:
 
         if limits.short_usage >= limits.short_limit:
             logger.warning(
-                f"Short-term rate limit exceeded: {limits.short_usage}/{limits.short_limit}"
+                "Short-term rate limit exceeded: %d/%d",
+                limits.short_usage,
+                limits.short_limit,
             )
             # Wait until next 15-min window (simplified)
             await asyncio.sleep(30)
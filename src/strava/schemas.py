@@ -3,12 +3,21 @@
 from datetime import datetime
 from typing import Any, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import (
+    AliasPath,
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+)
 
 
 class AthleteSchema(BaseModel):
     """Athlete information from Strava."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     firstname: str
     lastname: str
@@ -26,6 +35,8 @@ class AthleteSchema(BaseModel):
 class ClubSchema(BaseModel):
     """Club information from Strava."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     sport_type: str
@@ -39,6 +50,8 @@ class ClubSchema(BaseModel):
 class ActivitySchema(BaseModel):
     """Activity information from Strava."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     distance: float
@@ -50,7 +63,8 @@ class ActivitySchema(BaseModel):
     start_date: datetime
     start_date_local: datetime
     timezone: str
-    athlete: dict[str, Any]
+    # Strava nests the owner as {"athlete": {"id": ...}}; only the ID is kept
+    athlete_id: int = Field(validation_alias=AliasPath("athlete", "id"))
     achievement_count: Optional[int] = None
     kudos_count: Optional[int] = None
     comment_count: Optional[int] = None
@@ -60,10 +74,19 @@ class ActivitySchema(BaseModel):
     max_speed: Optional[float] = None
     workout_type: Optional[int] = None  # 0=default, 1=race, 2=long run, 3=workout
 
+    @model_serializer(mode="wrap")
+    def _nest_athlete(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        """Dump the owner in Strava's nested shape, as stored in raw_data."""
+        data = handler(self)
+        data["athlete"] = {"id": data.pop("athlete_id")}
+        return data
+
 
 class WebhookSubscriptionSchema(BaseModel):
     """Webhook subscription response from Strava."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     application_id: int
     callback_url: str
@@ -92,6 +115,8 @@ class WebhookCallbackSchema(BaseModel):
 class WebhookEventSchema(BaseModel):
     """Webhook event update from Strava."""
 
+    model_config = ConfigDict(frozen=True)
+
     object_type: Literal["activity", "athlete"]
     object_id: int
     aspect_type: Literal["create", "update", "delete"]
@@ -104,6 +129,8 @@ class WebhookEventSchema(BaseModel):
 class RateLimitInfo(BaseModel):
     """Rate limit information from response headers."""
 
+    model_config = ConfigDict(frozen=True)
+
     short_usage: int  # 15-minute usage
     long_usage: int  # Daily usage
     short_limit: int  # 15-minute limit
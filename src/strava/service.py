@@ -1,32 +1,165 @@
 """Strava service layer for managing athlete clients."""
 
 import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
+import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.models import User
 from src.auth.service import auth_service
+from src.core.lifespan import manager
 from src.strava.client import AsyncStravaClient
 from src.strava.rate_limiter import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Max number of cached clients per worker process
+MAX_CACHED_CLIENTS = 1024
+
+# Seconds before token expiry at which a token is treated as expired
+TOKEN_EXPIRY_MARGIN = 300
+
 
 class StravaService:
     """Service layer for Strava API operations.
 
     Handles token management, client instantiation, and business logic.
+    Clients are cached per athlete and rate limiter priority until shortly
+    before the athlete's access token expires, so repeated calls skip the
+    token lookup and keep the rate limiter's state. A client is dropped from
+    the cache as soon as Strava rejects its token.
+
+    Cached clients never own their HTTP client: they use the caller's or
+    one shared by the service. A client dropped from the cache may still be
+    in use by a request, so dropping it never closes any connections.
     """
 
+    def __init__(self):
+        # (athlete_id, priority) -> (client, token_expires_at)
+        self._clients: OrderedDict[tuple[int, str], tuple[AsyncStravaClient, int]] = (
+            OrderedDict()
+        )
+        # Used by cached clients when the caller passes no HTTP client
+        self._http_client: httpx.AsyncClient | None = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the service's shared HTTP client, creating it on first use."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(timeout=30.0)
+        return self._http_client
+
+    def _get_cached_client(
+        self, athlete_id: int, priority: str
+    ) -> AsyncStravaClient | None:
+        """Return the cached client for an athlete if its token is still valid.
+
+        Parameters
+        ----------
+        athlete_id : int
+            Strava athlete ID
+        priority : str
+            Rate limiter priority ('high', 'medium', 'low')
+
+        Returns
+        -------
+        AsyncStravaClient | None
+            Cached client, or None if missing or expired
+        """
+        key = (athlete_id, priority)
+        cached = self._clients.get(key)
+        if cached is None:
+            return None
+
+        client, expires_at = cached
+        if time.time() >= expires_at - TOKEN_EXPIRY_MARGIN:
+            self._discard(key)
+            return None
+
+        self._clients.move_to_end(key)
+        return client
+
+    def _cache_client(
+        self,
+        athlete_id: int,
+        priority: str,
+        access_token: str,
+        expires_at: int,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> AsyncStravaClient:
+        """Create a client for an athlete's token and cache it.
+
+        Parameters
+        ----------
+        athlete_id : int
+            Strava athlete ID
+        priority : str
+            Rate limiter priority ('high', 'medium', 'low')
+        access_token : str
+            Valid Strava access token
+        expires_at : int
+            Token expiry as a Unix timestamp
+        http_client : httpx.AsyncClient, optional
+            Shared HTTP client for the Strava client to send requests with.
+            Defaults to the service's shared HTTP client.
+
+        Returns
+        -------
+        AsyncStravaClient
+            Newly created client
+        """
+        key = (athlete_id, priority)
+        self._discard(key)
+
+        client = AsyncStravaClient(
+            access_token=access_token,
+            rate_limiter=AsyncRateLimiter(priority=priority),
+            http_client=http_client or self._get_http_client(),
+            on_unauthorized=lambda: self._discard_client(key, client),
+        )
+        self._clients[key] = (client, expires_at)
+
+        # Evict least recently used clients
+        while len(self._clients) > MAX_CACHED_CLIENTS:
+            self._discard(next(iter(self._clients)))
+
+        return client
+
+    def _discard(self, key: tuple[int, str]) -> None:
+        """Remove a cached client, leaving it usable by requests holding it."""
+        self._clients.pop(key, None)
+
+    def _discard_client(self, key: tuple[int, str], client: AsyncStravaClient) -> None:
+        """Remove a cached client if it is still the one cached under key."""
+        cached = self._clients.get(key)
+        if cached is not None and cached[0] is client:
+            self._discard(key)
+
+    def invalidate(self, athlete_id: int) -> None:
+        """Drop all cached clients for an athlete.
+
+        Parameters
+        ----------
+        athlete_id : int
+            Strava athlete ID
+        """
+        for key in [key for key in self._clients if key[0] == athlete_id]:
+            self._discard(key)
+
     async def get_client_for_athlete(
         self,
         db: AsyncSession,
         athlete_id: int,
         priority: str = "high",
+        http_client: httpx.AsyncClient | None = None,
     ) -> AsyncStravaClient:
         """Get an authenticated Strava client for a specific athlete.
 
-        Automatically handles token refresh if needed.
+        Automatically handles token refresh if needed. Returns the cached
+        client without touching the database while its token is valid.
 
         Parameters
         ----------
@@ -36,6 +169,8 @@ class StravaService:
             Strava athlete ID
         priority : str
             Rate limiter priority ('high', 'medium', 'low')
+        http_client : httpx.AsyncClient, optional
+            Shared HTTP client for the Strava client to send requests with
 
         Returns
         -------
@@ -47,24 +182,35 @@ class StravaService:
         TokenExpired
             If token is expired and cannot be refreshed
         """
+        client = self._get_cached_client(athlete_id, priority)
+        if client is not None:
+            return client
+
         # Get user from database
         user = await auth_service.get_user_by_athlete_id(db, athlete_id)
         if not user:
             raise ValueError(f"Athlete {athlete_id} not found in database")
 
         # Check if token needs refresh
-        if user.is_token_expired():
-            logger.info(f"Token expired for athlete {athlete_id}, refreshing...")
-            user = await auth_service.refresh_token_if_needed(db, user)
-
-        # Create client with user's access token
-        rate_limiter = AsyncRateLimiter(priority=priority)
-        return AsyncStravaClient(
-            access_token=user.access_token, rate_limiter=rate_limiter
+        if user.is_token_expired(TOKEN_EXPIRY_MARGIN):
+            logger.info("Token expired for athlete %s, refreshing...", athlete_id)
+            user = await auth_service.refresh_token_if_needed(
+                db, user, TOKEN_EXPIRY_MARGIN
+            )
+
+        return self._cache_client(
+            athlete_id,
+            priority,
+            user.access_token,
+            user.token_expires_at,
+            http_client,
         )
 
     async def get_client_for_user(
-        self, user: User, priority: str = "high"
+        self,
+        user: User,
+        priority: str = "high",
+        http_client: httpx.AsyncClient | None = None,
     ) -> AsyncStravaClient:
         """Get an authenticated Strava client for a User object.
 
@@ -77,16 +223,36 @@ class StravaService:
             User model with valid access_token
         priority : str
             Rate limiter priority ('high', 'medium', 'low')
+        http_client : httpx.AsyncClient, optional
+            Shared HTTP client for the Strava client to send requests with
 
         Returns
         -------
         AsyncStravaClient
             Authenticated client
         """
-        rate_limiter = AsyncRateLimiter(priority=priority)
-        return AsyncStravaClient(
-            access_token=user.access_token, rate_limiter=rate_limiter
+        client = self._get_cached_client(user.id, priority)
+        if client is not None and client.access_token == user.access_token:
+            return client
+
+        return self._cache_client(
+            user.id, priority, user.access_token, user.token_expires_at, http_client
         )
 
+    async def close_clients(self) -> None:
+        """Drop all cached clients and close the shared HTTP client."""
+        self._clients.clear()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
 
 strava_service = StravaService()
+
+
+@manager.add
+@asynccontextmanager
+async def strava_clients_lifespan() -> AsyncIterator[dict]:
+    """Close cached Strava clients on shutdown."""
+    yield {}
+    await strava_service.close_clients()
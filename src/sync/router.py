@@ -2,17 +2,20 @@
 
 from datetime import datetime
 
+import httpx
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.dependencies import get_session, verify_admin_api_key
+from src.dependencies import get_http_client, get_session, verify_admin_api_key
 from src.sync.service import sync_service
 
 router = APIRouter(
     prefix="/sync",
     tags=["sync"],
     dependencies=[Depends(verify_admin_api_key)],
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -42,11 +45,12 @@ class SyncResponse(BaseModel):
     pages_processed: int
 
 
-@router.post("/activities/{athlete_id}", response_model=SyncResponse)
+@router.post("/activities/{athlete_id}", responses={200: {"model": SyncResponse}})
 async def sync_athlete_activities(
     athlete_id: int,
     request: SyncRequest,
     db: AsyncSession = Depends(get_session),
+    http_client: httpx.AsyncClient = Depends(get_http_client),
 ):
     """Sync historical activities for an athlete.
 
@@ -62,17 +66,22 @@ async def sync_athlete_activities(
         Date range for syncing (after is required, before is optional)
     db : AsyncSession
         Database session (injected)
+    http_client : httpx.AsyncClient
+        Shared HTTP client (injected)
 
     Returns
     -------
-    SyncResponse
-        Summary of sync operation including counts and any errors
+    ORJSONResponse
+        Summary of sync operation including counts and any errors, shaped
+        like SyncResponse
     """
     result = await sync_service.sync_athlete_activities(
         db=db,
         athlete_id=athlete_id,
         after=request.after,
         before=request.before,
+        http_client=http_client,
     )
 
-    return SyncResponse(**result)
+    # The service builds this dict itself, so skip response model validation
+    return ORJSONResponse(result)
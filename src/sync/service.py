@@ -1,15 +1,24 @@
 """Sync service for backfilling activities from Strava."""
 
+import asyncio
 import logging
 from datetime import datetime
 
+import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.activities.service import activity_service
+from src.strava.schemas import ActivitySchema
 from src.strava.service import strava_service
 
 logger = logging.getLogger(__name__)
 
+# Activities per page requested from Strava (API maximum)
+PER_PAGE = 200
+
+# Pages fetched concurrently when the sync range has a fixed end date
+PARALLEL_PAGES = 4
+
 
 class SyncService:
     """Service for syncing historical activities from Strava."""
@@ -20,6 +29,7 @@ class SyncService:
         athlete_id: int,
         after: datetime,
         before: datetime | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> dict:
         """Sync activities for an athlete within a date range.
 
@@ -34,6 +44,8 @@ class SyncService:
         before : datetime | None
             End date for syncing activities (inclusive).
             If None, uses current time.
+        http_client : httpx.AsyncClient | None
+            Shared HTTP client to send Strava requests with
 
         Returns
         -------
@@ -45,13 +57,15 @@ class SyncService:
         before_timestamp = int(before.timestamp()) if before else None
 
         logger.info(
-            f"Starting activity sync for athlete {athlete_id} "
-            f"from {after} to {before or 'now'}"
+            "Starting activity sync for athlete %s from %s to %s",
+            athlete_id,
+            after,
+            before or "now",
         )
 
         # Get Strava client with low priority (bulk operation)
         client = await strava_service.get_client_for_athlete(
-            db, athlete_id, priority="low"
+            db, athlete_id, priority="low", http_client=http_client
         )
 
         synced_count = 0
@@ -59,64 +73,97 @@ class SyncService:
         errors = []
         page = 1
 
-        try:
-            while True:
-                # Fetch activities page by page (max 200 per page)
-                activities = await client.get_activities(
-                    after=after_timestamp,
-                    before=before_timestamp,
-                    page=page,
-                    per_page=200,
-                )
-
-                # No more activities to fetch
-                if not activities:
-                    logger.info(f"No more activities found on page {page}")
-                    break
-
-                logger.info(
-                    f"Fetched {len(activities)} activities on page {page} "
-                    f"for athlete {athlete_id}"
-                )
-
-                # Store each activity
-                for activity_data in activities:
-                    try:
-                        # Check if activity exists
-                        existing = await activity_service.get_activity(
-                            db, activity_data.id
-                        )
+        # Pages fetched but not yet stored; bounded to cap memory use
+        pages: asyncio.Queue[tuple[int, list[ActivitySchema]] | None] = asyncio.Queue(
+            maxsize=2
+        )
 
-                        if existing:
-                            # Update existing activity
-                            await activity_service.update_activity(
-                                db, existing, activity_data
-                            )
-                            updated_count += 1
-                        else:
-                            # Create new activity
-                            await activity_service.create_activity(db, activity_data)
-                            synced_count += 1
-
-                    except Exception as e:
-                        error_msg = (
-                            f"Failed to sync activity {activity_data.id}: {str(e)}"
+        async def fetch_page(number: int) -> list[ActivitySchema]:
+            return await client.get_activities(
+                after=after_timestamp,
+                before=before_timestamp,
+                page=number,
+                per_page=PER_PAGE,
+            )
+
+        async def fetch_batch(first: int, count: int) -> list[list[ActivitySchema]]:
+            """Fetch consecutive pages together, cancelling all if one fails."""
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(fetch_page(first + i)) for i in range(count)
+                    ]
+            except ExceptionGroup as e:
+                raise e.exceptions[0]
+            return [task.result() for task in tasks]
+
+        async def fetch_pages() -> None:
+            """Fetch activities page by page (max 200 per page) into the queue."""
+            nonlocal page
+            try:
+                while True:
+                    # With a fixed end date pages don't shift, so once the
+                    # first page is full the following ones are fetched together
+                    in_flight = PARALLEL_PAGES if before_timestamp and page > 1 else 1
+                    batch = await fetch_batch(page, in_flight)
+
+                    for activities in batch:
+                        # No more activities to fetch
+                        if not activities:
+                            logger.info("No more activities found on page %d", page)
+                            return
+
+                        logger.info(
+                            "Fetched %d activities on page %d for athlete %s",
+                            len(activities),
+                            page,
+                            athlete_id,
                         )
-                        logger.error(error_msg)
-                        errors.append(error_msg)
-
-                # Move to next page
-                page += 1
-
-        except Exception as e:
-            error_msg = f"Error during sync on page {page}: {str(e)}"
-            logger.error(error_msg)
-            errors.append(error_msg)
+                        await pages.put((page, activities))
+
+                        # Move to next page
+                        page += 1
+
+                        # A short page is the last one
+                        if len(activities) < PER_PAGE:
+                            return
+
+            except Exception as e:
+                error_msg = f"Error during sync on page {page}: {str(e)}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+
+            finally:
+                await pages.put(None)
+
+        async def store_pages() -> None:
+            """Store each fetched page in a single upsert."""
+            nonlocal synced_count, updated_count
+            while (item := await pages.get()) is not None:
+                page_number, activities = item
+                try:
+                    inserted = await activity_service.upsert_activities(db, activities)
+                    created = sum(inserted.values())
+                    synced_count += created
+                    updated_count += len(inserted) - created
+
+                except Exception as e:
+                    await db.rollback()
+                    error_msg = (
+                        f"Failed to sync activities on page {page_number}: {str(e)}"
+                    )
+                    logger.error(error_msg)
+                    errors.append(error_msg)
+
+        # Fetch the next page from Strava while the previous one is being stored
+        await asyncio.gather(fetch_pages(), store_pages())
 
         logger.info(
-            f"Activity sync completed for athlete {athlete_id}: "
-            f"{synced_count} created, {updated_count} updated, "
-            f"{len(errors)} errors"
+            "Activity sync completed for athlete %s: %d created, %d updated, %d errors",
+            athlete_id,
+            synced_count,
+            updated_count,
+            len(errors),
         )
 
         return {
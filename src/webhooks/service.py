@@ -0,0 +1,458 @@
+"""Processing of Strava webhook events."""
+
+import asyncio
+import math
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+import httpx
+from loguru import logger
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.activities.service import activity_service
+from src.config import get_settings
+from src.core.expiring_set import ExpiringDict
+from src.core.request_context import set_request_id
+from src.strava.client import AsyncStravaClient
+from src.strava.exceptions import RateLimitExceeded, StravaException
+from src.strava.schemas import ActivitySchema, WebhookEventSchema
+from src.strava.service import strava_service
+
+settings = get_settings()
+
+# Bounds Strava requests in flight from all webhook workers
+_strava_requests = asyncio.Semaphore(settings.STRAVA_CONCURRENCY)
+
+# Activity aspect types whose handler stores the current activity, which is
+# fetched from Strava first
+FETCHED_ASPECTS = frozenset({"create", "update"})
+
+# Errors from a Strava fetch that only fail the event they belong to
+FETCH_ERRORS = (StravaException, httpx.HTTPError, ValueError)
+
+# Seconds after handling an activity event during which repeats are dropped
+DUPLICATE_EVENT_WINDOW = 5
+
+# Seconds of clock skew allowed between Strava's event_time and this host
+EVENT_TIME_SKEW = 2
+
+# Max handled activity events remembered
+MAX_HANDLED_EVENTS = 4096
+
+
+@dataclass
+class _ActivityLock:
+    """Lock for one activity and the number of tasks holding or awaiting it."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    waiters: int = 0
+
+
+_activity_locks: dict[int, _ActivityLock] = {}
+
+# (activity_id, aspect_type) -> time.time() when handling started
+_handled_events = ExpiringDict(maxsize=MAX_HANDLED_EVENTS, ttl=DUPLICATE_EVENT_WINDOW)
+
+
+@asynccontextmanager
+async def _activity_lock(activity_id: int) -> AsyncIterator[None]:
+    """Serialize processing of events for the same activity."""
+    entry = _activity_locks.get(activity_id)
+    if entry is None:
+        entry = _activity_locks[activity_id] = _ActivityLock()
+    entry.waiters += 1
+    try:
+        async with entry.lock:
+            yield
+    finally:
+        entry.waiters -= 1
+        if entry.waiters == 0:
+            del _activity_locks[activity_id]
+
+
+def _is_duplicate_event(event: WebhookEventSchema) -> bool:
+    """Check if a recent handling of the same event already covers this one.
+
+    Handling fetches the current activity from Strava, so an event that
+    happened before that handling started needs no further work. Strava's
+    event_time is whole seconds on Strava's clock, so only events at least
+    ``EVENT_TIME_SKEW`` seconds before the start count as covered; a change
+    made in the same second may have been missed by the fetch.
+    """
+    started_at = _handled_events.get((event.object_id, event.aspect_type))
+    return (
+        started_at is not None
+        and time.time() - started_at < DUPLICATE_EVENT_WINDOW
+        and event.event_time < math.floor(started_at) - EVENT_TIME_SKEW
+    )
+
+
+def _mark_event_handled(event: WebhookEventSchema, started_at: float) -> None:
+    """Remember a handled event for ``DUPLICATE_EVENT_WINDOW`` seconds."""
+    _handled_events[(event.object_id, event.aspect_type)] = started_at
+
+
+async def handle_activity_events(
+    db: AsyncSession,
+    http_client: httpx.AsyncClient,
+    items: list[tuple[WebhookEventSchema, str]],
+) -> list[tuple[WebhookEventSchema, str]]:
+    """Apply a batch of activity events.
+
+    Events are dispatched through ``ACTIVITY_HANDLERS``, each handler being
+    called once with all the events for it. Create and update share one
+    handler: each activity is fetched from Strava, concurrently up to
+    ``STRAVA_CONCURRENCY`` requests per process, and stored with a single
+    upsert, so no existence check is needed beforehand. Events are expected
+    to be coalesced already, one per activity.
+
+    Every write runs in a savepoint so one failing write doesn't undo the
+    others, and the batch is committed once at the end.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        Database session for the batch
+    http_client : httpx.AsyncClient
+        Shared HTTP client for Strava requests
+    items : list[tuple[WebhookEventSchema, str]]
+        Activity events with the request ID of the HTTP request that
+        delivered each one
+
+    Returns
+    -------
+    list[tuple[WebhookEventSchema, str]]
+        Items whose fetch hit the Strava rate limit, to be retried later
+    """
+    async with AsyncExitStack() as stack:
+        # Duplicates in other batches wait here, then see these as handled;
+        # locks are taken in ID order so batches can't deadlock
+        for activity_id in sorted({event.object_id for event, _ in items}):
+            await stack.enter_async_context(_activity_lock(activity_id))
+
+        pending = []
+        for event, request_id in items:
+            if _is_duplicate_event(event):
+                logger.info(
+                    "Duplicate activity event dropped",
+                    request_id=request_id,
+                    activity_id=event.object_id,
+                    aspect_type=event.aspect_type,
+                )
+            else:
+                pending.append((event, request_id))
+
+        started_at = time.time()
+        for event, request_id in pending:
+            set_request_id(request_id)
+            logger.debug(
+                "Processing activity event",
+                request_id=request_id,
+                aspect_type=event.aspect_type,
+                activity_id=event.object_id,
+                athlete_id=event.owner_id,
+                updates=event.updates,
+            )
+
+        # Fetch before writing anything: looking up a client can refresh a
+        # token, which commits or rolls back the session
+        activities, rate_limited = await _fetch_activities(
+            db,
+            http_client,
+            [item for item in pending if item[0].aspect_type in FETCHED_ASPECTS],
+        )
+
+        batches: dict[ActivityHandler, list] = {}
+        for event, _ in pending:
+            activity_data = activities.get(event.object_id)
+            if event.aspect_type in FETCHED_ASPECTS and activity_data is None:
+                continue  # The fetch failed or is retried later
+            handler = ACTIVITY_HANDLERS[event.aspect_type]
+            batches.setdefault(handler, []).append((event, activity_data))
+
+        applied = []
+        for handler, batch in batches.items():
+            applied.extend(await handler(db, batch))
+
+        await db.commit()
+        for event in applied:
+            _mark_event_handled(event, started_at)
+
+    if rate_limited:
+        logger.warning(
+            "Activity fetches rate limited",
+            activity_ids=[event.object_id for event, _ in rate_limited],
+        )
+    return rate_limited
+
+
+async def _get_clients(
+    db: AsyncSession,
+    athlete_ids: set[int],
+    http_client: httpx.AsyncClient | None = None,
+) -> dict[int, AsyncStravaClient]:
+    """Get a Strava client for each athlete, skipping those that fail.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        Database session
+    athlete_ids : set[int]
+        Strava athlete IDs
+    http_client : httpx.AsyncClient, optional
+        Shared HTTP client for Strava requests
+
+    Returns
+    -------
+    dict[int, AsyncStravaClient]
+        Maps athlete ID to an authenticated client
+    """
+    clients = {}
+    for athlete_id in athlete_ids:
+        try:
+            clients[athlete_id] = await strava_service.get_client_for_athlete(
+                db, athlete_id, http_client=http_client
+            )
+        except (ValueError, SQLAlchemyError) as e:
+            logger.error(
+                "Error getting Strava client",
+                athlete_id=athlete_id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+    return clients
+
+
+async def _fetch_activities(
+    db: AsyncSession,
+    http_client: httpx.AsyncClient,
+    items: list[tuple[WebhookEventSchema, str]],
+) -> tuple[dict[int, ActivitySchema], list[tuple[WebhookEventSchema, str]]]:
+    """Fetch the activities events refer to from Strava concurrently.
+
+    Events whose client or fetch fails are logged and left out.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        Database session, used to look up clients
+    http_client : httpx.AsyncClient
+        Shared HTTP client for Strava requests
+    items : list[tuple[WebhookEventSchema, str]]
+        Activity events with their request IDs
+
+    Returns
+    -------
+    tuple[dict[int, ActivitySchema], list[tuple[WebhookEventSchema, str]]]
+        Fetched activities by ID, and the items whose fetch hit the Strava
+        rate limit
+    """
+    # Clients are looked up one at a time since they may use the session
+    clients = await _get_clients(
+        db, {event.owner_id for event, _ in items}, http_client
+    )
+    items = [item for item in items if item[0].owner_id in clients]
+
+    results = await asyncio.gather(
+        *(_fetch_activity(clients[event.owner_id], event) for event, _ in items),
+        return_exceptions=True,
+    )
+
+    activities = {}
+    rate_limited = []
+    for item, result in zip(items, results):
+        event = item[0]
+        if isinstance(result, RateLimitExceeded):
+            rate_limited.append(item)
+        elif isinstance(result, FETCH_ERRORS):
+            logger.error(
+                "Error fetching activity",
+                activity_id=event.object_id,
+                aspect_type=event.aspect_type,
+                error=str(result),
+                error_type=type(result).__name__,
+            )
+        elif isinstance(result, BaseException):
+            # Bugs and cancellation fail the whole batch
+            raise result
+        else:
+            activities[event.object_id] = result
+    return activities, rate_limited
+
+
+async def _fetch_activity(
+    client: AsyncStravaClient, event: WebhookEventSchema
+) -> ActivitySchema:
+    """Fetch the activity an event refers to from Strava.
+
+    Parameters
+    ----------
+    client : AsyncStravaClient
+        Client for the activity's athlete
+    event : WebhookEventSchema
+        The webhook event
+
+    Returns
+    -------
+    ActivitySchema
+        Activity details
+    """
+    async with _strava_requests:
+        activity_data = await client.get_activity(event.object_id)
+
+    logger.debug(
+        "Fetched activity from Strava",
+        activity_id=event.object_id,
+        name=activity_data.name,
+        distance=activity_data.distance,
+        activity_type=activity_data.type,
+    )
+    return activity_data
+
+
+async def _store_activities(
+    db: AsyncSession,
+    batch: list[tuple[WebhookEventSchema, Optional[ActivitySchema]]],
+) -> list[WebhookEventSchema]:
+    """Upsert fetched activities in a savepoint, without committing.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        Database session
+    batch : list[tuple[WebhookEventSchema, Optional[ActivitySchema]]]
+        Create and update events with the activity fetched for each
+
+    Returns
+    -------
+    list[WebhookEventSchema]
+        The applied events; none if storing failed
+    """
+    try:
+        # Insert or update the whole batch in a single statement
+        async with db.begin_nested():
+            inserted = await activity_service.upsert_activities(
+                db, [activity_data for _, activity_data in batch], commit=False
+            )
+    except SQLAlchemyError as e:
+        logger.error(
+            "Error storing activities",
+            activity_ids=[event.object_id for event, _ in batch],
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        return []
+
+    logger.info(
+        "Activities stored in database",
+        activity_ids=list(inserted),
+        created=sum(inserted.values()),
+    )
+    return [event for event, _ in batch]
+
+
+async def _delete_activities(
+    db: AsyncSession,
+    batch: list[tuple[WebhookEventSchema, Optional[ActivitySchema]]],
+) -> list[WebhookEventSchema]:
+    """Delete the activities events refer to, without committing.
+
+    Each delete runs in its own savepoint.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        Database session
+    batch : list[tuple[WebhookEventSchema, Optional[ActivitySchema]]]
+        Delete events; nothing is fetched for them
+
+    Returns
+    -------
+    list[WebhookEventSchema]
+        The applied events
+    """
+    applied = []
+    for event, _ in batch:
+        activity_id = event.object_id
+        try:
+            async with db.begin_nested():
+                deleted = await activity_service.delete_activity(
+                    db, activity_id, commit=False
+                )
+        except SQLAlchemyError as e:
+            logger.error(
+                "Error deleting activity",
+                activity_id=activity_id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            continue
+
+        if deleted:
+            logger.info("Activity deleted from database", activity_id=activity_id)
+        else:
+            logger.warning(
+                "Activity not found in database for deletion",
+                activity_id=activity_id,
+            )
+        applied.append(event)
+    return applied
+
+
+def _handle_athlete_update(event: WebhookEventSchema) -> None:
+    """Handle an athlete profile update.
+
+    Only logged for now; athlete updates are not stored yet, which is why
+    they are only queued when ``HANDLE_ATHLETE_UPDATES`` is set.
+    """
+    logger.info(
+        "Athlete update event received",
+        athlete_id=event.owner_id,
+        updates=event.updates,
+    )
+
+
+# Applies a batch of activity events (with the activity fetched for those in
+# FETCHED_ASPECTS) and returns the events that were applied
+ActivityHandler = Callable[
+    [AsyncSession, list[tuple[WebhookEventSchema, Optional[ActivitySchema]]]],
+    Awaitable[list[WebhookEventSchema]],
+]
+
+# Handler for each activity aspect type; create and update share a handler,
+# so their events are stored with one upsert
+ACTIVITY_HANDLERS: dict[str, ActivityHandler] = {
+    "create": _store_activities,
+    "update": _store_activities,
+    "delete": _delete_activities,
+}
+
+# Handler for each athlete aspect type
+# (athletes don't have 'create' or 'delete' events)
+ATHLETE_HANDLERS: dict[str, Callable[[WebhookEventSchema], None]] = {
+    "update": _handle_athlete_update,
+}
+
+
+async def handle_athlete_event(db: AsyncSession, event: WebhookEventSchema) -> None:
+    """Handle athlete-related webhook events.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        Database session
+    event : WebhookEventSchema
+        The webhook event
+    """
+    logger.debug(
+        "Processing athlete event",
+        aspect_type=event.aspect_type,
+        athlete_id=event.owner_id,
+    )
+
+    handler = ATHLETE_HANDLERS.get(event.aspect_type)
+    if handler is not None:
+        handler(event)
@@ -0,0 +1,346 @@
+"""Worker pool that processes queued Strava webhook events."""
+
+import asyncio
+import itertools
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import asyncpg
+import httpx
+from fastapi import FastAPI
+from loguru import logger
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import get_settings
+from src.core.expiring_set import ExpiringSet
+from src.core.lifespan import manager
+from src.core.request_context import set_request_id
+from src.strava.schemas import WebhookEventSchema
+from src.webhooks.service import handle_activity_events, handle_athlete_event
+
+settings = get_settings()
+
+# Seconds to wait for queued events to finish on shutdown
+DRAIN_TIMEOUT = 10
+
+# Seconds a worker waits after its first event to collect a batch
+BATCH_WINDOW = 0.25
+
+# Max queued events taken into one batch
+QUEUE_BATCH_MAX = 100
+
+# Seconds to wait before queuing rate limited or failed events again
+RETRY_BACKOFF = 60
+
+# Errors from an unreachable database, which SQLAlchemy doesn't always wrap;
+# events that hit them are retried after RETRY_BACKOFF
+DATABASE_UNAVAILABLE_ERRORS = (
+    OSError,
+    asyncpg.PostgresConnectionError,
+    asyncpg.InterfaceError,
+)
+
+# Queue priority per aspect type (lowest first); deletes make pending
+# creates and updates for the same activity obsolete
+ASPECT_PRIORITY = {"delete": 0, "update": 1, "create": 2}
+
+# Tie-breaker keeping events of equal priority in arrival order
+_sequence = itertools.count()
+
+# IDs of activities with a delete queued in the last 5 minutes
+_deleted_activities = ExpiringSet(maxsize=4096, ttl=300)
+
+# Pending tasks that queue rate limited or failed events again
+_requeue_tasks: set[asyncio.Task] = set()
+
+
+def enqueue_event(
+    queue: asyncio.PriorityQueue, event: WebhookEventSchema, request_id: str
+) -> None:
+    """Queue an event for the workers by aspect type priority.
+
+    Queuing an activity delete tombstones the activity, so creates and
+    updates for it that are still queued are skipped.
+
+    Parameters
+    ----------
+    queue : asyncio.PriorityQueue
+        Webhook event queue
+    event : WebhookEventSchema
+        Validated webhook event
+    request_id : str
+        Request ID from the HTTP request for tracking
+
+    Raises
+    ------
+    asyncio.QueueFull
+        If the queue is at capacity
+    """
+    queue.put_nowait(
+        (
+            ASPECT_PRIORITY[event.aspect_type],
+            next(_sequence),
+            event.object_type,
+            event,
+            request_id,
+        )
+    )
+
+    if event.object_type == "activity" and event.aspect_type == "delete":
+        _deleted_activities.add(event.object_id)
+
+
+def _is_obsolete(object_type: str, event: WebhookEventSchema) -> bool:
+    """Check if an event targets an activity that has a delete queued."""
+    return (
+        object_type == "activity"
+        and event.aspect_type != "delete"
+        and event.object_id in _deleted_activities
+    )
+
+
+def coalesce_events(
+    items: list[tuple[str, WebhookEventSchema, str]],
+) -> list[tuple[str, WebhookEventSchema, str]]:
+    """Merge queued events that target the same object.
+
+    A delete supersedes every other event for the activity. Otherwise the
+    latest event is kept; create and update are both handled by fetching
+    the current activity, so one fetch covers all of them.
+
+    Parameters
+    ----------
+    items : list[tuple[str, WebhookEventSchema, str]]
+        Queued (object_type, event, request_id) items
+
+    Returns
+    -------
+    list[tuple[str, WebhookEventSchema, str]]
+        One item per object, in the order first seen
+    """
+    merged: dict[tuple[str, int], tuple[str, WebhookEventSchema, str]] = {}
+    for item in items:
+        object_type, event, _ = item
+        key = (object_type, event.object_id)
+        kept = merged.get(key)
+        if (
+            kept is None
+            or event.aspect_type == "delete"
+            or (
+                kept[1].aspect_type != "delete"
+                and event.event_time >= kept[1].event_time
+            )
+        ):
+            merged[key] = item
+    return list(merged.values())
+
+
+async def _requeue_after_backoff(
+    queue: asyncio.PriorityQueue, items: list[tuple[WebhookEventSchema, str]]
+) -> None:
+    """Queue events again after ``RETRY_BACKOFF`` seconds."""
+    await asyncio.sleep(RETRY_BACKOFF)
+    for event, request_id in items:
+        try:
+            enqueue_event(queue, event, request_id)
+        except asyncio.QueueFull:
+            logger.error(
+                "Webhook queue full, dropping retried event",
+                request_id=request_id,
+                object_id=event.object_id,
+            )
+
+
+def _retry_later(
+    queue: asyncio.PriorityQueue, items: list[tuple[WebhookEventSchema, str]]
+) -> None:
+    """Schedule events to be queued again after the retry backoff."""
+    task = asyncio.create_task(_requeue_after_backoff(queue, items))
+    _requeue_tasks.add(task)
+    task.add_done_callback(_requeue_tasks.discard)
+
+
+def _retry_on_database_unavailable(
+    queue: asyncio.PriorityQueue,
+    items: list[tuple[WebhookEventSchema, str]],
+    error: Exception,
+) -> None:
+    """Log an unreachable database and retry the events it failed."""
+    logger.warning(
+        "Database unavailable, retrying webhook events later",
+        events=len(items),
+        retry_in=RETRY_BACKOFF,
+        error=str(error),
+        error_type=type(error).__name__,
+    )
+    _retry_later(queue, items)
+
+
+async def _next_batch(
+    queue: asyncio.PriorityQueue,
+) -> list[tuple[str, WebhookEventSchema, str]]:
+    """Wait for an event, then collect what arrives within the batch window.
+
+    Events come out highest priority first; the returned items drop the
+    queue's ordering fields.
+    """
+    entries = [await queue.get()]
+    await asyncio.sleep(BATCH_WINDOW)
+    while len(entries) < QUEUE_BATCH_MAX and not queue.empty():
+        entries.append(queue.get_nowait())
+    return [entry[2:] for entry in entries]
+
+
+async def _process_batch(
+    queue: asyncio.PriorityQueue,
+    db: AsyncSession,
+    http_client: httpx.AsyncClient,
+    batch: list[tuple[str, WebhookEventSchema, str]],
+) -> None:
+    """Apply a coalesced batch of events using one database session.
+
+    Events that hit the Strava rate limit or an unreachable database are
+    queued again after ``RETRY_BACKOFF`` seconds, since the router has
+    already acknowledged them to Strava.
+
+    Parameters
+    ----------
+    queue : asyncio.PriorityQueue
+        Webhook event queue, for retrying events
+    db : AsyncSession
+        Database session for the batch
+    http_client : httpx.AsyncClient
+        Shared HTTP client for Strava requests
+    batch : list[tuple[str, WebhookEventSchema, str]]
+        Coalesced (object_type, event, request_id) items
+    """
+    activity_items = [
+        (event, request_id)
+        for object_type, event, request_id in batch
+        if object_type == "activity"
+    ]
+    athlete_items = [
+        (event, request_id)
+        for object_type, event, request_id in batch
+        if object_type == "athlete"
+    ]
+
+    if activity_items:
+        try:
+            rate_limited = await handle_activity_events(db, http_client, activity_items)
+            if rate_limited:
+                _retry_later(queue, rate_limited)
+        except DATABASE_UNAVAILABLE_ERRORS as e:
+            # The session is unusable, so retry the athlete events as well
+            _retry_on_database_unavailable(queue, activity_items + athlete_items, e)
+            return
+        except SQLAlchemyError as e:
+            logger.error(
+                "Webhook worker failed to process activity events",
+                activity_ids=[event.object_id for event, _ in activity_items],
+                error=str(e),
+                error_type=type(e).__name__,
+                exc_info=True,
+            )
+            await db.rollback()
+
+    try:
+        for event, request_id in athlete_items:
+            set_request_id(request_id)
+            try:
+                async with db.begin_nested():
+                    await handle_athlete_event(db, event)
+            except SQLAlchemyError as e:
+                logger.error(
+                    "Athlete event processing failed",
+                    request_id=request_id,
+                    athlete_id=event.owner_id,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    exc_info=True,
+                )
+
+        if athlete_items:
+            await db.commit()
+    except DATABASE_UNAVAILABLE_ERRORS as e:
+        _retry_on_database_unavailable(queue, athlete_items, e)
+
+
+async def _webhook_worker(
+    queue: asyncio.PriorityQueue,
+    session_maker: async_sessionmaker,
+    http_client: httpx.AsyncClient,
+) -> None:
+    """Process queued webhook events in coalesced batches until cancelled.
+
+    Each batch uses one database session.
+
+    Parameters
+    ----------
+    queue : asyncio.PriorityQueue
+        Queue of events added by ``enqueue_event``
+    session_maker : async_sessionmaker
+        Database session maker
+    http_client : httpx.AsyncClient
+        Shared HTTP client for Strava requests
+    """
+    while True:
+        items = await _next_batch(queue)
+        try:
+            batch = coalesce_events(
+                [item for item in items if not _is_obsolete(item[0], item[1])]
+            )
+            if len(batch) < len(items):
+                logger.debug(
+                    "Coalesced webhook events", received=len(items), kept=len(batch)
+                )
+
+            async with session_maker() as db:
+                await _process_batch(queue, db, http_client, batch)
+        except Exception as e:
+            # Last resort so a bug doesn't stop the worker; cancellation
+            # is not an Exception and still ends the loop
+            logger.error(
+                "Unexpected error processing webhook batch",
+                events=len(items),
+                error=str(e),
+                error_type=type(e).__name__,
+                exc_info=True,
+            )
+        finally:
+            for _ in items:
+                queue.task_done()
+
+
+@manager.add
+@asynccontextmanager
+async def webhook_worker_lifespan(app: FastAPI) -> AsyncIterator[dict]:
+    """
+    Manage the webhook event queue and its workers.
+    Starts the workers on startup, lets them finish queued events on
+    shutdown (up to DRAIN_TIMEOUT seconds), then stops them.
+    """
+    queue: asyncio.PriorityQueue = asyncio.PriorityQueue(
+        maxsize=settings.WEBHOOK_QUEUE_SIZE
+    )
+    workers = [
+        asyncio.create_task(
+            _webhook_worker(queue, app.state.session_maker, app.state.http_client)
+        )
+        for _ in range(settings.WEBHOOK_WORKERS)
+    ]
+    logger.info("Webhook workers started", workers=settings.WEBHOOK_WORKERS)
+
+    yield {"webhook_queue": queue}
+
+    try:
+        await asyncio.wait_for(queue.join(), timeout=DRAIN_TIMEOUT)
+    except TimeoutError:
+        logger.warning("Webhook events dropped on shutdown", pending=queue.qsize())
+
+    tasks = [*workers, *_requeue_tasks]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    logger.info("Webhook workers stopped")
@@ -0,0 +1,31 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from src.auth import known_athletes as module
+from src.auth.known_athletes import KnownAthletes
+
+
+@asynccontextmanager
+async def session_maker():
+    yield None
+
+
+def test_changes_during_refresh_survive_the_snapshot(monkeypatch):
+    athletes = KnownAthletes()
+    athletes.add(2)
+
+    async def list_authorized_athlete_ids(db):
+        # Snapshot taken before the calls below committed
+        athletes.add(1)
+        athletes.discard(2)
+        return [2, 3]
+
+    monkeypatch.setattr(
+        module.auth_service, "list_authorized_athlete_ids", list_authorized_athlete_ids
+    )
+    asyncio.run(athletes.refresh(session_maker))
+
+    assert 1 in athletes
+    assert 2 not in athletes
+    assert 3 in athletes
+    assert 4 not in athletes
@@ -0,0 +1,84 @@
+import pytest
+
+from src.core import expiring_set
+from src.core.expiring_set import ExpiringDict, ExpiringSet
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(expiring_set.time, "monotonic", clock)
+    return clock
+
+
+def test_member_expires_after_ttl(clock):
+    members = ExpiringSet(maxsize=10, ttl=5)
+    members.add("a")
+
+    clock.now += 4.9
+    assert "a" in members
+
+    clock.now += 0.1
+    assert "a" not in members
+
+
+def test_adding_again_restarts_expiry(clock):
+    members = ExpiringSet(maxsize=10, ttl=5)
+    members.add("a")
+    clock.now += 4
+    members.add("a")
+    clock.now += 4
+
+    assert "a" in members
+
+
+def test_stale_members_are_evicted_on_add(clock):
+    members = ExpiringSet(maxsize=10, ttl=5)
+    members.add("a")
+    members.add("b")
+    clock.now += 6
+    members.add("c")
+
+    assert len(members) == 1
+    assert "c" in members
+
+
+def test_oldest_members_are_evicted_past_maxsize(clock):
+    members = ExpiringSet(maxsize=2, ttl=5)
+    for member in ("a", "b", "c"):
+        members.add(member)
+
+    assert len(members) == 2
+    assert "a" not in members
+    assert "b" in members and "c" in members
+
+
+def test_readding_moves_member_to_the_back(clock):
+    members = ExpiringSet(maxsize=2, ttl=5)
+    members.add("a")
+    members.add("b")
+    members.add("a")
+    members.add("c")
+
+    assert "a" in members
+    assert "b" not in members
+
+
+def test_dict_get_returns_value_until_expired(clock):
+    values = ExpiringDict(maxsize=10, ttl=5)
+    values["a"] = 1
+
+    assert values.get("a") == 1
+    assert values.get("missing", 0) == 0
+
+    clock.now += 5
+    assert values.get("a") is None
+    assert values.get("a", 0) == 0
@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import Column, create_engine, literal, select
+from sqlalchemy.sql.visitors import replacement_traverse
+
+from src.scoring.calculator import calculate_base_points
+from src.scoring.service import _BASE_POINTS
+
+
+@pytest.fixture(scope="module")
+def connection():
+    # Integer division and modulo behave the same in SQLite and Postgres
+    # for the non-negative moving times scored here
+    with create_engine("sqlite://").connect() as connection:
+        yield connection
+
+
+def sql_base_points(connection, moving_time: int) -> int:
+    """Evaluate _BASE_POINTS with ``moving_time`` in place of the column."""
+    expression = replacement_traverse(
+        _BASE_POINTS,
+        {},
+        lambda element: (
+            literal(moving_time)
+            if isinstance(element, Column) and element.key == "moving_time"
+            else None
+        ),
+    )
+    return connection.execute(select(expression)).scalar_one()
+
+
+@pytest.mark.parametrize(
+    "moving_time, points",
+    [
+        (0, 0),
+        (29, 0),
+        (30, 0),  # round(0.5) rounds half to even
+        (31, 1),
+        (89, 1),
+        (90, 2),  # round(1.5)
+        (91, 2),
+        (150, 2),  # round(2.5)
+        (3600, 60),
+    ],
+)
+def test_base_points_rounds_half_to_even(connection, moving_time, points):
+    assert sql_base_points(connection, moving_time) == points
+
+
+def test_base_points_matches_calculator(connection):
+    for moving_time in range(0, 2 * 3600 + 1, 5):
+        assert sql_base_points(connection, moving_time) == calculate_base_points(
+            moving_time
+        ), moving_time
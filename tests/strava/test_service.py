@@ -0,0 +1,21 @@
+import asyncio
+import time
+
+from src.strava.service import StravaService
+
+
+def test_dropped_clients_keep_their_connections():
+    async def run() -> None:
+        service = StravaService()
+        expires_at = int(time.time()) + 3600
+        client = service._cache_client(1, "high", "token", expires_at)
+
+        service.invalidate(1)
+        await asyncio.sleep(0)
+        assert not client._get_http_client().is_closed
+        assert service._get_cached_client(1, "high") is None
+
+        await service.close_clients()
+        assert client._get_http_client().is_closed
+
+    asyncio.run(run())
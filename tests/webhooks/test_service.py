@@ -0,0 +1,89 @@
+import pytest
+
+from src.core import expiring_set
+from src.core.expiring_set import ExpiringDict
+from src.strava.schemas import WebhookEventSchema
+from src.webhooks import service
+from src.webhooks.service import (
+    DUPLICATE_EVENT_WINDOW,
+    EVENT_TIME_SKEW,
+    _is_duplicate_event,
+    _mark_event_handled,
+)
+
+STARTED_AT = 1_700_000_000.0
+
+
+def make_event(aspect_type: str, event_time: float) -> WebhookEventSchema:
+    return WebhookEventSchema(
+        object_type="activity",
+        object_id=1,
+        aspect_type=aspect_type,
+        owner_id=1,
+        subscription_id=1,
+        event_time=int(event_time),
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive time.time() and time.monotonic() from one settable value."""
+
+    class Clock:
+        now = STARTED_AT
+
+    monkeypatch.setattr(service.time, "time", lambda: Clock.now)
+    monkeypatch.setattr(expiring_set.time, "monotonic", lambda: Clock.now)
+    monkeypatch.setattr(
+        service,
+        "_handled_events",
+        ExpiringDict(maxsize=16, ttl=DUPLICATE_EVENT_WINDOW),
+    )
+    return Clock
+
+
+def test_event_before_handling_started_is_duplicate(clock):
+    _mark_event_handled(make_event("update", STARTED_AT - 10), STARTED_AT)
+
+    clock.now += 1
+    assert _is_duplicate_event(make_event("update", STARTED_AT - 3))
+
+
+def test_event_after_handling_started_is_not_duplicate(clock):
+    _mark_event_handled(make_event("update", STARTED_AT - 10), STARTED_AT)
+
+    clock.now += 1
+    assert not _is_duplicate_event(make_event("update", STARTED_AT))
+
+
+def test_duplicates_are_only_dropped_within_the_window(clock):
+    _mark_event_handled(make_event("update", STARTED_AT - 10), STARTED_AT)
+
+    clock.now += DUPLICATE_EVENT_WINDOW
+    assert not _is_duplicate_event(make_event("update", STARTED_AT - 3))
+
+
+def test_other_aspect_types_are_not_duplicates(clock):
+    _mark_event_handled(make_event("create", STARTED_AT - 10), STARTED_AT)
+
+    clock.now += 1
+    assert not _is_duplicate_event(make_event("update", STARTED_AT - 3))
+    assert not _is_duplicate_event(make_event("delete", STARTED_AT - 3))
+
+
+def test_event_in_the_same_second_as_handling_is_not_duplicate(clock):
+    # Handling started partway through the second the update happened in
+    started_at = STARTED_AT + 0.7
+    clock.now = started_at
+    _mark_event_handled(make_event("update", STARTED_AT - 10), started_at)
+
+    clock.now += 1
+    assert not _is_duplicate_event(make_event("update", STARTED_AT))
+
+
+def test_event_within_clock_skew_is_not_duplicate(clock):
+    _mark_event_handled(make_event("update", STARTED_AT - 10), STARTED_AT)
+
+    clock.now += 1
+    event = make_event("update", STARTED_AT - EVENT_TIME_SKEW)
+    assert not _is_duplicate_event(event)
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from src.core.expiring_set import ExpiringSet
+from src.strava.schemas import WebhookEventSchema
+from src.webhooks import worker
+from src.webhooks.worker import _is_obsolete, coalesce_events, enqueue_event
+
+
+def make_event(
+    object_id: int,
+    aspect_type: str,
+    event_time: int,
+    object_type: str = "activity",
+) -> WebhookEventSchema:
+    return WebhookEventSchema(
+        object_type=object_type,
+        object_id=object_id,
+        aspect_type=aspect_type,
+        owner_id=1,
+        subscription_id=1,
+        event_time=event_time,
+    )
+
+
+def item(event: WebhookEventSchema) -> tuple[str, WebhookEventSchema, str]:
+    return (event.object_type, event, f"req-{event.object_id}-{event.event_time}")
+
+
+@pytest.fixture(autouse=True)
+def deleted_activities(monkeypatch):
+    tombstones = ExpiringSet(maxsize=16, ttl=300)
+    monkeypatch.setattr(worker, "_deleted_activities", tombstones)
+    return tombstones
+
+
+def test_coalesce_merges_create_and_update_into_latest():
+    create = make_event(1, "create", event_time=100)
+    update = make_event(1, "update", event_time=105)
+
+    assert coalesce_events([item(create), item(update)]) == [item(update)]
+    assert coalesce_events([item(update), item(create)]) == [item(update)]
+
+
+def test_coalesce_delete_supersedes_other_events():
+    delete = make_event(1, "delete", event_time=100)
+    later_update = make_event(1, "update", event_time=200)
+    earlier_create = make_event(1, "create", event_time=50)
+
+    items = [item(earlier_create), item(delete), item(later_update)]
+    assert coalesce_events(items) == [item(delete)]
+
+
+def test_coalesce_keeps_objects_in_first_seen_order():
+    events = [
+        make_event(2, "create", event_time=100),
+        make_event(1, "create", event_time=101),
+        make_event(2, "update", event_time=102),
+    ]
+
+    result = coalesce_events([item(event) for event in events])
+    assert [event.object_id for _, event, _ in result] == [2, 1]
+    assert result[0] == item(events[2])
+
+
+def test_coalesce_keeps_object_types_apart():
+    activity = make_event(1, "update", event_time=100)
+    athlete = make_event(1, "update", event_time=100, object_type="athlete")
+
+    assert coalesce_events([item(activity), item(athlete)]) == [
+        item(activity),
+        item(athlete),
+    ]
+
+
+def test_queue_hands_out_deletes_first_then_arrival_order():
+    queue = asyncio.PriorityQueue()
+    create = make_event(1, "create", event_time=100)
+    update = make_event(2, "update", event_time=101)
+    delete = make_event(3, "delete", event_time=102)
+    for event in (create, update, delete):
+        enqueue_event(queue, event, "req")
+
+    order = [queue.get_nowait()[3] for _ in range(queue.qsize())]
+    assert order == [delete, update, create]
+
+
+def test_queued_delete_makes_pending_events_obsolete(deleted_activities):
+    queue = asyncio.PriorityQueue()
+    create = make_event(1, "create", event_time=100)
+    delete = make_event(1, "delete", event_time=101)
+    other = make_event(2, "create", event_time=100)
+
+    enqueue_event(queue, create, "req")
+    assert not _is_obsolete("activity", create)
+
+    enqueue_event(queue, delete, "req")
+    assert 1 in deleted_activities
+    assert _is_obsolete("activity", create)
+    assert not _is_obsolete("activity", delete)
+    assert not _is_obsolete("activity", other)
+
+
+def test_athlete_events_are_never_obsolete(deleted_activities):
+    deleted_activities.add(1)
+    athlete = make_event(1, "update", event_time=100, object_type="athlete")
+
+    assert not _is_obsolete("athlete", athlete)
+
+
+def test_unreachable_database_retries_the_batch(monkeypatch):
+    async def database_down(*args):
+        raise ConnectionRefusedError("connection refused")
+
+    monkeypatch.setattr(worker, "handle_activity_events", database_down)
+    monkeypatch.setattr(worker, "RETRY_BACKOFF", 0)
+    activity = make_event(1, "update", event_time=100)
+    athlete = make_event(2, "update", event_time=100, object_type="athlete")
+
+    async def process() -> list[WebhookEventSchema]:
+        queue = asyncio.PriorityQueue()
+        batch = [item(activity), item(athlete)]
+        await worker._process_batch(queue, None, None, batch)
+        await asyncio.gather(*worker._requeue_tasks)
+        return [queue.get_nowait()[3] for _ in range(queue.qsize())]
+
+    assert asyncio.run(process()) == [activity, athlete]